@@ -0,0 +1,132 @@
+import csv
+import datetime
+from itertools import accumulate
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from github_fetch import fetch_issues
+from report_rows import IST_OFFSET
+from report_window import DEFAULT_START, ReportWindow
+from sanitize import sanitize_batch
+
+# -----------------------------------------------------------------------------
+# Daily open-backlog time series.
+# An issue is open on day d if it was created on or before d and not closed
+# by d. Each issue becomes a +1 at its creation day and a -1 at its closing
+# day on an array of days (IST, as in the Created At / Closed At columns);
+# the running sum of that array is the number of open issues per day.
+# One series is built for all issues and one per label, over every day of
+# the report window, and written as a chart-ready sheet or CSV:
+#   Date, All, <label>, <label>, ...
+# Issues created before the window that were still open at its start count
+# from its first day, so the report crawl is topped up with them first
+# (see backlog_issues).
+# -----------------------------------------------------------------------------
+
+
+# UTC time of day from which the IST date is already the next day
+_IST_ROLLOVER = (datetime.datetime(2000, 1, 2) - IST_OFFSET).strftime("%H:%M:%S")
+
+
+def epoch_day(timestamp):
+    """
+    Day number (date.toordinal) of a GitHub timestamp, in IST.
+    Slicing the fixed-width timestamp avoids a strptime per call.
+    """
+    day = datetime.date(int(timestamp[0:4]), int(timestamp[5:7]), int(timestamp[8:10])).toordinal()
+    return day + 1 if timestamp[11:19] >= _IST_ROLLOVER else day
+
+
+def backlog_issues(owner, repo, issues, window, headers):
+    """
+    `issues` (created inside the window) plus the issues created before the
+    window that were still open at its start: those open now, and those
+    closed after the window start (so also updated after it).
+    """
+    if window.start <= DEFAULT_START:
+        return issues
+
+    before = ReportWindow(DEFAULT_START, window.start - datetime.timedelta(seconds=1))
+    still_open = fetch_issues(owner, repo, "open", before, headers)
+    closed_later = [
+        issue for issue in fetch_issues(owner, repo, "closed", before, headers, since=window.start_iso)
+        if issue.get("closed_at") and issue["closed_at"] >= window.start_iso
+    ]
+    return issues + still_open + closed_later
+
+
+def _open_counts(start_offsets, end_offsets, days):
+    """
+    Open issues per day from day offsets (already clipped to 0..days).
+    """
+    if numpy is not None:
+        delta = numpy.bincount(start_offsets, minlength=days + 1) - numpy.bincount(end_offsets, minlength=days + 1)
+        return numpy.cumsum(delta[:days]).tolist()
+
+    delta = [0] * (days + 1)
+    for offset in start_offsets:
+        delta[offset] += 1
+    for offset in end_offsets:
+        delta[offset] -= 1
+    return list(accumulate(delta[:days]))
+
+
+def backlog_table(issues, window):
+    """
+    Return (dates, {"All": counts, label: counts, ...}) with one count per day
+    of the window, labels in sorted order. Issues created before the window
+    count as open from its first day.
+    """
+    # One row per calendar date of the window as requested; the UTC bounds
+    # themselves would shift into the next IST day and add a row at the end
+    first_day = window.start.date().toordinal()
+    days = window.end.date().toordinal() - first_day + 1
+
+    def clip(day):
+        return min(max(day - first_day, 0), days)
+
+    # Day offsets of each issue's +1 and -1; issues still open end past the window
+    starts = [clip(epoch_day(issue["created_at"])) for issue in issues]
+    ends = [clip(epoch_day(issue["closed_at"])) if issue.get("closed_at") else days for issue in issues]
+
+    members = {}
+    for position, issue in enumerate(issues):
+        for name in {label["name"].lower() for label in issue.get("labels", [])}:
+            members.setdefault(name, []).append(position)
+
+    if numpy is not None:
+        starts = numpy.array(starts, dtype=numpy.int64)
+        ends = numpy.array(ends, dtype=numpy.int64)
+
+    series = {"All": _open_counts(starts, ends, days)}
+    for name in sorted(members):
+        positions = members[name]
+        if numpy is not None:
+            series[name] = _open_counts(starts[positions], ends[positions], days)
+        else:
+            series[name] = _open_counts([starts[p] for p in positions], [ends[p] for p in positions], days)
+
+    dates = [datetime.date.fromordinal(first_day + offset).isoformat() for offset in range(days)]
+    return dates, series
+
+
+def _table_rows(dates, series):
+    names = list(series)
+    yield ["Date"] + sanitize_batch(names)
+    columns = [series[name] for name in names]
+    for offset, date in enumerate(dates):
+        yield [date] + [column[offset] for column in columns]
+
+
+def add_backlog_sheet(wb, issues, window):
+    ws = wb.create_sheet("Open Backlog")
+    for row in _table_rows(*backlog_table(issues, window)):
+        ws.append(row)
+
+
+def write_backlog_csv(issues, window, filename):
+    with open(filename, "w", newline="", encoding="utf-8") as f:
+        csv.writer(f).writerows(_table_rows(*backlog_table(issues, window)))
@@ -0,0 +1,56 @@
+import argparse
+import importlib
+import time
+
+import raw_archive
+import report_window
+import snapshot_merge
+from report_rows import issue_rows
+from xlsx_parallel import write_workbook
+
+# -----------------------------------------------------------------------------
+# Script Description:
+# This script runs the per-repository extractors (extract_issues_*.py) and
+# writes all of them into one workbook with a sheet per repository.
+# Each sheet is rendered in its own process (see xlsx_parallel.py), so the
+# save time scales with the number of cores instead of the total row count.
+# -----------------------------------------------------------------------------
+
+EXTRACTORS = ["dotnet", "go", "java", "labeler", "node", "python", "stale"]
+
+
+def collect_sheets(names, window, args):
+    sheets = {}
+    for name in names:
+        extractor = importlib.import_module(f"extract_issues_{name}")
+
+        with raw_archive.open_from_args(args, extractor.OWNER, extractor.REPO) as archive:
+            passes = snapshot_merge.run_passes(extractor.get_issues, window, archive)
+            all_issues = snapshot_merge.consistent_snapshot(extractor.OWNER, extractor.REPO, passes, window,
+                                                            extractor.headers, archive)
+
+        print(f"📥 {extractor.OWNER}/{extractor.REPO}: {len(all_issues)} issues")
+        sheets[extractor.REPO] = issue_rows(all_issues, extractor.OWNER, extractor.REPO)
+    return sheets
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export the issues of several repositories into one workbook.")
+    parser.add_argument("--repos", nargs="+", choices=EXTRACTORS, default=EXTRACTORS,
+                        help="extractors to include, one sheet each (default: all)")
+    parser.add_argument("--output", default="issues_combined.xlsx", help="workbook to write")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker processes used to render sheets (default: one per sheet, up to the CPU count)")
+    report_window.add_window_arguments(parser)
+    raw_archive.add_archive_arguments(parser)
+    args = parser.parse_args()
+    window = report_window.window_from_args(parser, args)
+
+    start_time = time.time()
+
+    sheets = collect_sheets(args.repos, window, args)
+    write_workbook(sheets, args.output, max_workers=args.workers)
+
+    end_time = time.time()
+    elapsed_seconds = end_time - start_time
+    print(f"\n✅ Script completed in {elapsed_seconds:.2f} seconds.")
@@ -0,0 +1,261 @@
+import argparse
+import importlib
+import json
+import os
+import time
+
+import requests
+
+import report_window
+import snapshot_merge
+from combined_report import EXTRACTORS
+from github_fetch import API_URL, PER_PAGE, github_get
+
+# -----------------------------------------------------------------------------
+# Script Description:
+# This script keeps a local issue state for one repository up to date by
+# following its issue events feed instead of re-running the full crawl:
+#   GET /repos/{OWNER}/{REPO}/issues/events?per_page=100&page={n}
+# The feed is polled with If-None-Match (an unchanged feed answers 304, which
+# does not count against the rate limit) and never more often than the
+# X-Poll-Interval header allows. closed, reopened, labeled and unlabeled
+# events are applied to the state, and any event refreshes the issue's title.
+# Issues not in the state yet are added from the first event of any kind.
+# The feed has no event for opening an issue, so each poll also lists
+#   GET /repos/{OWNER}/{REPO}/issues?state=all&since={last change}
+# with If-None-Match as well, and merges in the issues updated since.
+# The state is saved as JSON, and the Excel report is regenerated from it
+# whenever something changed. The first run seeds the state with a full
+# get_issues crawl.
+# -----------------------------------------------------------------------------
+
+DEFAULT_INTERVAL = 60
+STATE_FIELDS = ("number", "title", "state", "created_at", "updated_at", "closed_at")
+
+
+def issue_snapshot(issue):
+    """
+    The part of an issue kept in the local state, as a plain dict.
+    """
+    snapshot = {field: issue.get(field) for field in STATE_FIELDS}
+    snapshot["labels"] = [{"name": label["name"]} for label in issue.get("labels", [])]
+    return snapshot
+
+
+def load_state(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        state = json.load(f)
+    # JSON object keys are strings; issues are keyed by number
+    state["issues"] = {int(number): issue for number, issue in state["issues"].items()}
+    return state
+
+
+def save_state(state, path):
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    os.replace(temp_path, path)
+
+
+def fetch_new_events(extractor, state):
+    """
+    Return (events newer than the state's last event, oldest first; poll interval).
+    An unchanged feed (304) returns no events without reading further pages.
+    """
+    url = f"{API_URL}/repos/{extractor.OWNER}/{extractor.REPO}/issues/events"
+    request_headers = dict(extractor.headers)
+    if state.get("etag"):
+        request_headers["If-None-Match"] = state["etag"]
+
+    response = github_get(url, request_headers, {"per_page": PER_PAGE, "page": 1})
+    interval = int(response.headers.get("X-Poll-Interval", DEFAULT_INTERVAL))
+    if response.status_code == 304:
+        return [], interval
+    etag = response.headers.get("ETag")
+
+    last_event_id = state.get("last_event_id") or 0
+    events = []
+    page = 1
+    data = response.json()
+    while data:
+        new_events = [event for event in data if event["id"] > last_event_id]
+        events.extend(new_events)
+        # Events are listed newest first; stop at the first page reaching known events
+        if len(new_events) < len(data) or len(data) < PER_PAGE:
+            break
+        page += 1
+        data = github_get(url, extractor.headers, {"per_page": PER_PAGE, "page": page}).json()
+
+    # Only remember the ETag once every new page was read, so a failed poll is retried in full
+    state["etag"] = etag
+    events.sort(key=lambda event: event["id"])
+    return events, interval
+
+
+def fetch_updated_issues(extractor, state):
+    """
+    Return the issues updated since the state's issues_since, newest first.
+    An unchanged listing (304) returns no issues without reading further pages.
+    """
+    url = f"{API_URL}/repos/{extractor.OWNER}/{extractor.REPO}/issues"
+    listed_since = snapshot_merge.crawl_start()
+    params = {"state": "all", "since": state["issues_since"], "per_page": PER_PAGE, "page": 1}
+    request_headers = dict(extractor.headers)
+    if state.get("issues_etag"):
+        request_headers["If-None-Match"] = state["issues_etag"]
+
+    response = github_get(url, request_headers, params)
+    if response.status_code == 304:
+        return []
+    etag = response.headers.get("ETag")
+
+    issues = []
+    data = response.json()
+    while data:
+        issues.extend(data)
+        if len(data) < PER_PAGE:
+            break
+        params["page"] += 1
+        data = github_get(url, extractor.headers, params).json()
+
+    # Only move `since` on when something came back: an empty listing keeps the
+    # same URL, so the next poll can be answered with a free 304
+    if issues:
+        state["issues_since"] = listed_since
+        etag = None
+    state["issues_etag"] = etag
+    return issues
+
+
+def apply_listed_issue(issues, issue):
+    """
+    Merge one issue from the listing into the local issues. Returns True if anything changed.
+    """
+    if "pull_request" in issue:
+        return False
+    local = issues.get(issue["number"])
+    if local is not None and (local.get("updated_at") or "") >= (issue.get("updated_at") or ""):
+        return False
+    issues[issue["number"]] = issue_snapshot(issue)
+    return True
+
+
+def apply_event(issues, event):
+    """
+    Apply one issue event to the local issues. Returns True if anything changed.
+    """
+    issue = event.get("issue")
+    if not issue or "pull_request" in issue:
+        return False
+
+    local = issues.get(issue["number"])
+    if local is None:
+        # Unknown issue (opened after the seed): whatever the event, the embedded
+        # issue is its current state
+        issues[issue["number"]] = issue_snapshot(issue)
+        return True
+
+    kind = event["event"]
+    before = dict(local, labels=list(local["labels"]))
+    if kind == "closed":
+        local["state"] = "closed"
+        local["closed_at"] = event["created_at"]
+    elif kind == "reopened":
+        local["state"] = "open"
+        local["closed_at"] = None
+    elif kind == "labeled":
+        name = event["label"]["name"]
+        if all(label["name"] != name for label in local["labels"]):
+            local["labels"].append({"name": name})
+    elif kind == "unlabeled":
+        name = event["label"]["name"]
+        local["labels"] = [label for label in local["labels"] if label["name"] != name]
+    # Every event embeds the issue, so any kind (renamed included) refreshes the title
+    local["title"] = issue.get("title", local["title"])
+    if local == before:
+        return False
+    local["updated_at"] = max(local.get("updated_at") or "", event["created_at"])
+    return True
+
+
+def seed_state(extractor):
+    # Record the newest event first so anything happening during the crawl is replayed.
+    # The ETag is not kept, so the first poll reads the feed again.
+    url = f"{API_URL}/repos/{extractor.OWNER}/{extractor.REPO}/issues/events"
+    latest = github_get(url, extractor.headers, {"per_page": 1}).json()
+    state = {"etag": None, "last_event_id": latest[0]["id"] if latest else 0, "issues": {}}
+
+    window = report_window.default_window()
+    passes = snapshot_merge.run_passes(extractor.get_issues, window)
+    state["issues_since"] = passes[0].started
+    state["issues_etag"] = None
+    for issue in snapshot_merge.consistent_snapshot(extractor.OWNER, extractor.REPO, passes, window, extractor.headers):
+        state["issues"][issue["number"]] = issue_snapshot(issue)
+    return state
+
+
+def write_report(extractor, state, parser, args, filename):
+    # Rebuilt on every write so that an open-ended window keeps moving with the clock
+    window = report_window.window_from_args(parser, args)
+    issues = [issue for issue in state["issues"].values() if window.contains(issue["created_at"])]
+    issues.sort(key=lambda issue: issue["number"], reverse=True)
+    extractor.issues_to_excel(issues, filename=filename)
+    print(f"📝 Wrote {len(issues)} issues to {filename}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Keep an issue report up to date from the repository events feed.")
+    parser.add_argument("repo", choices=EXTRACTORS, help="extractor whose repository is followed")
+    parser.add_argument("--state-file", help="local issue state (default: issues_state_<repo>.json)")
+    parser.add_argument("--output", help="workbook regenerated on changes (default: issues_live_<repo>.xlsx)")
+    parser.add_argument("--interval", type=int, default=DEFAULT_INTERVAL,
+                        help="minimum seconds between polls; X-Poll-Interval is honoured if longer")
+    parser.add_argument("--once", action="store_true", help="poll once and exit")
+    report_window.add_window_arguments(parser)
+    args = parser.parse_args()
+    report_window.window_from_args(parser, args)
+
+    extractor = importlib.import_module(f"extract_issues_{args.repo}")
+    state_file = args.state_file or f"issues_state_{args.repo}.json"
+    output = args.output or f"issues_live_{args.repo}.xlsx"
+
+    state = load_state(state_file)
+    if state is None:
+        print(f"🌱 Seeding {state_file} from a full crawl of {extractor.OWNER}/{extractor.REPO}")
+        state = seed_state(extractor)
+        save_state(state, state_file)
+        write_report(extractor, state, parser, args, output)
+    # State files written before the issue listing was polled start listing from now
+    state.setdefault("issues_since", snapshot_merge.crawl_start())
+
+    while True:
+        # Poll into a copy, so that a failure halfway leaves the ETags and
+        # `since` as they were and the next poll reads everything again
+        polled = dict(state)
+        try:
+            events, interval = fetch_new_events(extractor, polled)
+            updated_issues = fetch_updated_issues(extractor, polled)
+        except requests.RequestException as error:
+            # Keep the poller alive; the next poll retries
+            print(f"⚠️ Polling {extractor.OWNER}/{extractor.REPO} failed: {error}")
+            if args.once:
+                raise
+            time.sleep(args.interval)
+            continue
+        state = polled
+        changed = False
+        for event in events:
+            changed = apply_event(state["issues"], event) or changed
+            state["last_event_id"] = event["id"]
+        for issue in updated_issues:
+            changed = apply_listed_issue(state["issues"], issue) or changed
+        save_state(state, state_file)
+
+        if changed:
+            print(f"🔔 Applied {len(events)} new events and {len(updated_issues)} updated issues")
+            write_report(extractor, state, parser, args, output)
+        if args.once:
+            break
+        time.sleep(max(interval, args.interval))
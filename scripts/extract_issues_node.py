@@ -1,144 +1,79 @@
-import os
-import requests
-import datetime
+import argparse
 import openpyxl
 import time
-import re
-from openpyxl.styles import Font
+import backlog_series
+import label_flags
+import raw_archive
+import report_window
+import snapshot_merge
+import token_pool
+from github_fetch import fetch_issues
+from report_rows import issue_rows, write_issue_sheet
 
 # -----------------------------------------------------------------------------
 # Script Description:
 # This script fetches GitHub issues for the repository 'actions/setup-node'
 # using the REST API endpoint:
-#   GET /repos/actions/setup-node/issues?state={open|closed}&since={START_DATE}&per_page=100&page={n}
-# It collects issues created or updated in the last 4 months and exports them to an Excel file.
+#   GET /repos/actions/setup-node/issues?state={open|closed}&since={window start}&sort=created&direction=desc&per_page=100&page={n}
+# It collects issues created inside the report window (by default everything
+# since January 2019; see --from/--to/--months) and exports them to an Excel file.
 # -----------------------------------------------------------------------------
 
 # Auth and repo info
-TOKEN = os.getenv("GH_TOKEN")
-if not TOKEN:
-    raise EnvironmentError("Missing GitHub token. Please set 'GH_TOKEN' in your environment or GitHub Actions secrets.")
+# Requests are spread over GH_TOKEN and any comma-separated tokens in GH_TOKENS;
+# building the shared pool here fails fast when no token is set
+token_pool.default_pool()
 
 OWNER = "actions"
 REPO = "setup-node"
 
-# Define the starting date (January 2019)
-start_year = 2019
-start_month = 1
-
-# Get the current date
-current_date = datetime.datetime.now()
-current_year = current_date.year
-current_month = current_date.month
-
-# Calculate the total number of months
-months = (current_year - start_year) * 12 + (current_month - start_month)
-
-# Calculate date 5 months ago
-TODAY_DATE = datetime.datetime.utcnow()
-START_DATE = (TODAY_DATE - datetime.timedelta(days=30 * months)).isoformat() + "Z"
-TODAY_DATE = TODAY_DATE.isoformat() + "Z"
-PER_PAGE = 100
-
 headers = {
-    "Authorization": f"Bearer {TOKEN}",
     "Accept": "application/vnd.github.v3+json"
 }
 
-def get_issues(state):
-    issues = []
-    page = 1
-    while True:
-        url = f"https://api.github.com/repos/{OWNER}/{REPO}/issues"
-        params = {
-            "state": state,
-            "since": START_DATE,
-            "per_page": PER_PAGE,
-            "page": page
-        }
-        response = requests.get(url, headers=headers, params=params, timeout=90)
-        if response.status_code == 401:
-            raise PermissionError("❌ Unauthorized. Check if your GH_TOKEN is valid and has correct permissions.")
-        response.raise_for_status()
-        data = response.json()
-        if not data:
-            break
-        for issue in data:
-            created_at = issue.get("created_at")
-            if created_at and START_DATE <= created_at <= TODAY_DATE and "pull_request" not in issue:
-                issues.append(issue)
-        page += 1
-    return issues
+def get_issues(state, window=None, archive=None):
+    return fetch_issues(OWNER, REPO, state, window or report_window.default_window(), headers, archive)
 
-def sanitize_string(value):
-    """
-    Remove illegal characters from a string to make it safe for Excel.
-    """
-    if not isinstance(value, str):
-        return value
-    # Remove ASCII control characters (0-31) except for tab, newline, and carriage return
-    return re.sub(r"[\x00-\x08\x0B-\x1F]", "", value)
-
-def issues_to_excel(issues, filename="issues_setup_node.xlsx"):
+def issues_to_excel(issues, filename="issues_setup_node.xlsx", with_label_flags=False, backlog_window=None, backlog_issues=None):
     wb = openpyxl.Workbook()
     ws = wb.active
     ws.title = "Issues"
 
-    headers = [
-        "Number", "Title", "State", "Created At", "Created Month",
-        "Closed At", "Closed Month", "Days Taken", "Labels"
-    ]
-    ws.append(headers)
-
-    ist_offset = datetime.timedelta(hours=5, minutes=30)
-    for issue in issues:
-        labels = {lbl["name"].lower() for lbl in issue.get("labels", [])}
-        created_at_raw = issue.get("created_at")
-        closed_at_raw = issue.get("closed_at")
-
-        created_date = datetime.datetime.strptime(created_at_raw, "%Y-%m-%dT%H:%M:%SZ") + ist_offset if created_at_raw else None
-        closed_date = datetime.datetime.strptime(closed_at_raw, "%Y-%m-%dT%H:%M:%SZ") + ist_offset if closed_at_raw else None
-
-        created_at = created_date.strftime("%Y-%m-%d") if created_date else ""
-        closed_at = closed_date.strftime("%Y-%m-%d") if closed_date else ""
-        created_month = created_date.strftime("%b-%Y") if created_date else ""
-        closed_month = closed_date.strftime("%b-%Y") if closed_date else ""
-        days_taken = (closed_date - created_date).days if created_date and closed_date else ""
-
-        issue_number = issue["number"]
-        issue_url = f"https://github.com/{OWNER}/{REPO}/issues/{issue_number}"
-
-        # Sanitize all string values in the row
-        row = [
-            issue_number,
-            sanitize_string(issue["title"]),
-            sanitize_string(issue["state"]),
-            sanitize_string(created_at),
-            sanitize_string(created_month),
-            sanitize_string(closed_at),
-            sanitize_string(closed_month),
-            days_taken,
-            sanitize_string(", ".join(labels))
-        ]
-
-        ws.append(row)
-
-        cell = ws.cell(row=ws.max_row, column=1)
-        cell.value = issue_number
-        cell.font = Font(color="0000EE", underline="single")
-        cell.hyperlink = issue_url
+    write_issue_sheet(ws, issue_rows(issues, OWNER, REPO))
+    if with_label_flags:
+        label_flags.add_label_sheets(wb, issues)
+    if backlog_window:
+        backlog_series.add_backlog_sheet(wb, issues if backlog_issues is None else backlog_issues, backlog_window)
 
     wb.save(filename)
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=f"Export {OWNER}/{REPO} issues to Excel.")
+    report_window.add_window_arguments(parser)
+    raw_archive.add_archive_arguments(parser)
+    parser.add_argument("--label-flags", action="store_true",
+                        help="add one-hot label flag and label co-occurrence sheets")
+    parser.add_argument("--backlog", action="store_true",
+                        help="add a daily open-backlog sheet (all issues and per label)")
+    parser.add_argument("--backlog-csv", metavar="PATH", help="also write the daily open backlog to a CSV file")
+    args = parser.parse_args()
+    window = report_window.window_from_args(parser, args)
+
     start_time = time.time()
 
-    open_issues = get_issues("open")
-    closed_issues = get_issues("closed")
-    all_issues = open_issues + closed_issues
+    with raw_archive.open_from_args(args, OWNER, REPO) as archive:
+        passes = snapshot_merge.run_passes(get_issues, window, archive)
+        all_issues = snapshot_merge.consistent_snapshot(OWNER, REPO, passes, window, headers, archive)
+
+    backlog_issues = None
+    if args.backlog or args.backlog_csv:
+        backlog_issues = backlog_series.backlog_issues(OWNER, REPO, all_issues, window, headers)
 
-    issues_to_excel(all_issues, filename="issues_setup_node.xlsx")
+    issues_to_excel(all_issues, filename="issues_setup_node.xlsx", with_label_flags=args.label_flags,
+                    backlog_window=window if args.backlog else None, backlog_issues=backlog_issues)
+    if args.backlog_csv:
+        backlog_series.write_backlog_csv(backlog_issues, window, args.backlog_csv)
 
     end_time = time.time()
     elapsed_seconds = end_time - start_time
-    print(f"\n✅ Script completed in {elapsed_seconds:.2f} seconds.")
\ No newline at end of file
+    print(f"\n✅ Script completed in {elapsed_seconds:.2f} seconds.")
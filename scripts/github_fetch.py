@@ -0,0 +1,96 @@
+import requests
+
+import token_pool
+from issue_decode import decode_full_page, decode_issue, decode_issue_page
+
+# -----------------------------------------------------------------------------
+# Shared GitHub REST fetching for the issue reports.
+# Lists the issues of a repository with
+#   GET /repos/{owner}/{repo}/issues?state={open|closed}&since={window start}&sort=created&direction=desc&per_page=100&page={n}
+# and keeps the ones created inside the report window (see report_window.py).
+# Pages arrive newest first, so paging stops as soon as a page reaches issues
+# created before the window, or a short page shows there is nothing left.
+# Requests are authorised with a token from token_pool, so callers pass
+# headers without an Authorization entry.
+# -----------------------------------------------------------------------------
+
+API_URL = "https://api.github.com"
+PER_PAGE = 100
+
+
+def github_get(url, headers, params=None, pool=None):
+    pool = pool or token_pool.default_pool()
+    while True:
+        token = pool.acquire()
+        request_headers = dict(headers, Authorization=f"Bearer {token}")
+        response = requests.get(url, headers=request_headers, params=params, timeout=90)
+        # A rate-limited token is retired and an unauthorized one dropped by the
+        # pool; retry with the next best one
+        if not pool.update(token, response):
+            break
+    if response.status_code == 401:
+        # Only reached once the pool has no valid token left
+        raise PermissionError("❌ Unauthorized. Check if your GH_TOKEN / GH_TOKENS are valid and have correct permissions.")
+    response.raise_for_status()
+    return response
+
+
+def fetch_issues(owner, repo, state, window, headers, archive=None, since=None, first_page=1):
+    """
+    Fetch the issues of one state created inside `window`.
+    `since` (an ISO timestamp) narrows the crawl to issues updated after it;
+    by default every issue updated since the window start is listed.
+    `first_page` skips the pages before it (used to resume a listing).
+    If an ArchiveWriter is given, every page is also streamed to it as returned
+    by the API (pull requests and issues outside the window included).
+    """
+    issues = []
+    page = first_page
+    while True:
+        url = f"{API_URL}/repos/{owner}/{repo}/issues"
+        params = {
+            "state": state,
+            # Issues created inside the window were also updated after its start
+            "since": since or window.start_iso,
+            "sort": "created",
+            "direction": "desc",
+            "per_page": PER_PAGE,
+            "page": page
+        }
+        content = github_get(url, headers, params).content
+        # The archive keeps every field; the report only needs issue_decode.FIELDS
+        data = decode_full_page(content) if archive else decode_issue_page(content)
+        if not data:
+            break
+        if archive:
+            archive.write_page(data)
+        for issue in data:
+            created_at = issue.get("created_at")
+            if created_at and window.contains(created_at) and "pull_request" not in issue:
+                issues.append(issue)
+
+        # The last issue on the page is the oldest one; everything after it is older still
+        oldest_created_at = data[-1].get("created_at")
+        if len(data) < PER_PAGE or (oldest_created_at and oldest_created_at < window.start_iso):
+            break
+        page += 1
+    return issues
+
+
+def fetch_issue(owner, repo, number, headers, archive=None):
+    """
+    Fetch a single issue; returns None if it no longer exists.
+    If an ArchiveWriter is given, the issue is also written to it.
+    """
+    url = f"{API_URL}/repos/{owner}/{repo}/issues/{number}"
+    try:
+        content = github_get(url, headers).content
+    except requests.HTTPError as error:
+        if error.response is not None and error.response.status_code in (404, 410):
+            return None
+        raise
+    if not archive:
+        return decode_issue(content)
+    issue = decode_full_page(content)
+    archive.write_page([issue])
+    return issue
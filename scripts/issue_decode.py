@@ -0,0 +1,92 @@
+import json
+from typing import List, Optional
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# -----------------------------------------------------------------------------
+# Decoding of issue-list pages.
+# The report only reads a handful of fields from each issue, so pages are
+# decoded from the raw response bytes into just those fields:
+#   - msgspec (if installed): typed structs; every other field, including the
+#     nested user/reactions/... objects, is skipped without being built
+#   - orjson (if installed): fast full decode; projecting the dicts down to
+#     the fields afterwards costs more than it saves, so they are kept whole
+#   - otherwise the stdlib json module, as response.json() would
+# The decoded issues support the dict-style access the report code uses
+# (issue["title"], issue.get("labels", []), "pull_request" in issue).
+# -----------------------------------------------------------------------------
+
+FIELDS = ("number", "title", "state", "created_at", "updated_at", "closed_at", "labels", "pull_request")
+
+
+if msgspec:
+    class _DictAccess:
+        __slots__ = ()
+
+        def get(self, key, default=None):
+            value = getattr(self, key, None)
+            return default if value is None else value
+
+        def __getitem__(self, key):
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key)
+
+        def __contains__(self, key):
+            return getattr(self, key, None) is not None
+
+    class Label(_DictAccess, msgspec.Struct):
+        name: str = ""
+
+    class PullRequest(msgspec.Struct):
+        pass
+
+    class Issue(_DictAccess, msgspec.Struct):
+        number: int
+        title: str = ""
+        state: str = ""
+        created_at: Optional[str] = None
+        updated_at: Optional[str] = None
+        closed_at: Optional[str] = None
+        labels: List[Label] = []
+        # Only its presence matters (it marks pull requests), so none of its fields are decoded
+        pull_request: Optional[PullRequest] = None
+
+    _page_decoder = msgspec.json.Decoder(List[Issue])
+    _issue_decoder = msgspec.json.Decoder(Issue)
+
+
+def decode_full_page(content):
+    """
+    Decode a page into complete issue dicts (used when the raw JSON is kept).
+    """
+    if orjson:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def decode_issue_page(content):
+    """
+    Decode the raw bytes of an issue-list page into issues that hold at least FIELDS.
+    """
+    if msgspec:
+        return _page_decoder.decode(content)
+    return decode_full_page(content)
+
+
+def decode_issue(content):
+    """
+    Decode the raw bytes of a single issue (GET /repos/{owner}/{repo}/issues/{number}).
+    """
+    if msgspec:
+        return _issue_decoder.decode(content)
+    return decode_full_page(content)
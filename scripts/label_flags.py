@@ -0,0 +1,87 @@
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from sanitize import sanitize_batch
+
+# -----------------------------------------------------------------------------
+# One-hot label flags.
+# All label names seen across the crawl are interned to column indexes, and
+# each issue's labels become a bitset (an int with one bit per label). With
+# NumPy installed the bitsets are unpacked into a boolean matrix so filters
+# ("bug AND needs-triage") and co-occurrence counts are array operations.
+# Two extra sheets are written next to the Issues sheet:
+#   "Label Flags"          Number + one 0/1 column per label
+#   "Label Co-occurrence"  issues carrying both labels (diagonal: label totals)
+# Label names are lower-cased, as in the Labels column of the report.
+# -----------------------------------------------------------------------------
+
+
+def intern_labels(issues):
+    """
+    Return (label names in sorted order, one bitset per issue).
+    """
+    label_sets = [{label["name"].lower() for label in issue.get("labels", [])} for issue in issues]
+    names = sorted(set().union(*label_sets))
+    index = {name: position for position, name in enumerate(names)}
+
+    bitsets = []
+    for labels in label_sets:
+        bits = 0
+        for name in labels:
+            bits |= 1 << index[name]
+        bitsets.append(bits)
+    return names, bitsets
+
+
+def flag_matrix(names, bitsets):
+    """
+    Boolean matrix (issues x labels) built from the bitsets; needs NumPy.
+    """
+    width = max(1, (len(names) + 7) // 8)
+    packed = numpy.frombuffer(b"".join(bits.to_bytes(width, "little") for bits in bitsets), dtype=numpy.uint8)
+    unpacked = numpy.unpackbits(packed.reshape(len(bitsets), width), axis=1, bitorder="little")
+    return unpacked[:, :len(names)].astype(bool)
+
+
+def cooccurrence_counts(names, bitsets):
+    """
+    counts[i][j] = number of issues carrying both names[i] and names[j].
+    """
+    if numpy is not None:
+        flags = flag_matrix(names, bitsets).astype(numpy.int64)
+        return (flags.T @ flags).tolist()
+
+    counts = [[0] * len(names) for _ in names]
+    for bits in bitsets:
+        positions = [position for position in range(bits.bit_length()) if bits >> position & 1]
+        for i in positions:
+            row = counts[i]
+            for j in positions:
+                row[j] += 1
+    return counts
+
+
+def flag_rows(names, bitsets):
+    """
+    0/1 flag values per issue, one per label in `names` order.
+    """
+    if numpy is not None:
+        return flag_matrix(names, bitsets).astype(numpy.int8).tolist()
+    return [[bits >> position & 1 for position in range(len(names))] for bits in bitsets]
+
+
+def add_label_sheets(wb, issues):
+    names, bitsets = intern_labels(issues)
+    cell_names = sanitize_batch(names)
+
+    ws = wb.create_sheet("Label Flags")
+    ws.append(["Number"] + cell_names)
+    for issue, flags in zip(issues, flag_rows(names, bitsets)):
+        ws.append([issue["number"]] + flags)
+
+    ws = wb.create_sheet("Label Co-occurrence")
+    ws.append(["Label"] + cell_names)
+    for name, counts in zip(cell_names, cooccurrence_counts(names, bitsets)):
+        ws.append([name] + counts)
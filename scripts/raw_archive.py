@@ -0,0 +1,179 @@
+import contextlib
+import datetime
+import gzip
+import json
+import mmap
+import os
+import shutil
+import tempfile
+from array import array
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# -----------------------------------------------------------------------------
+# Raw issue archive.
+# While fetching, every issue returned by the API can be streamed as one JSON
+# line into a compressed JSONL file (one file per repository and run). The
+# reconciliation requests of snapshot_merge.py are archived too, so an issue
+# can appear more than once; its last line is the most recent copy:
+#   {archive_dir}/{owner}_{repo}_{YYYYmmddTHHMMSSZ}.jsonl.zst   (zstandard)
+#   {archive_dir}/{owner}_{repo}_{YYYYmmddTHHMMSSZ}.jsonl.gz    (gzip fallback)
+# ArchiveReader gives indexed random access to such a file so other jobs can
+# reprocess the full issue JSON (assignees, milestones, reactions, ...)
+# without spending API quota.
+# zstd needs the optional 'zstandard' package; gzip always works.
+# -----------------------------------------------------------------------------
+
+EXTENSIONS = {"zstd": ".jsonl.zst", "gzip": ".jsonl.gz"}
+
+
+def default_compression():
+    return "zstd" if zstandard else "gzip"
+
+
+def archive_path(archive_dir, owner, repo, compression, started=None):
+    started = started or datetime.datetime.now(datetime.timezone.utc)
+    return os.path.join(archive_dir, f"{owner}_{repo}_{started:%Y%m%dT%H%M%SZ}{EXTENSIONS[compression]}")
+
+
+def _compression_for(path):
+    if path.endswith(".zst"):
+        return "zstd"
+    if path.endswith(".gz"):
+        return "gzip"
+    return None
+
+
+def _require_zstandard():
+    if not zstandard:
+        raise ImportError("zstd archives need the 'zstandard' package (pip install zstandard); use gzip instead.")
+
+
+def _open_decompressed(path):
+    compression = _compression_for(path)
+    if compression == "zstd":
+        _require_zstandard()
+        return zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True)
+    if compression == "gzip":
+        return gzip.open(path, "rb")
+    return open(path, "rb")
+
+
+class ArchiveWriter:
+    """
+    Append-only compressed JSONL writer. Use as a context manager or call close().
+    """
+
+    def __init__(self, path, compression=None):
+        self.path = path
+        self.compression = compression or _compression_for(path) or default_compression()
+        self.count = 0
+        if self.compression == "zstd":
+            _require_zstandard()
+            self._file = open(path, "wb")
+            self._stream = zstandard.ZstdCompressor().stream_writer(self._file)
+        else:
+            self._file = open(path, "wb")
+            self._stream = gzip.GzipFile(fileobj=self._file, mode="wb")
+
+    def write_page(self, issues):
+        lines = b"".join(json.dumps(issue, separators=(",", ":")).encode("utf-8") + b"\n" for issue in issues)
+        self._stream.write(lines)
+        self.count += len(issues)
+
+    def close(self):
+        if self._stream:
+            self._stream.close()
+            self._file.close()
+            self._stream = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class ArchiveReader:
+    """
+    Random access to an archive by line number.
+    The file is decompressed once into an anonymous temporary file that is
+    memory-mapped; a line-offset index is built over the mapping, so
+    reader[i] only parses the one line it returns.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = tempfile.TemporaryFile()
+        with _open_decompressed(path) as source:
+            shutil.copyfileobj(source, self._file)
+        self._file.flush()
+
+        self._offsets = array("Q")
+        self._map = None
+        size = self._file.tell()
+        if size:
+            self._map = mmap.mmap(self._file.fileno(), size, access=mmap.ACCESS_READ)
+            position = 0
+            while position < size:
+                self._offsets.append(position)
+                newline = self._map.find(b"\n", position)
+                position = size if newline == -1 else newline + 1
+        self._size = size
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def line(self, index):
+        """
+        Raw bytes of one archived issue, without the trailing newline.
+        """
+        start = self._offsets[index]
+        end = self._offsets[index + 1] if index + 1 < len(self._offsets) else self._size
+        return self._map[start:end].rstrip(b"\n")
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("archive line out of range")
+        return json.loads(self.line(index))
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield json.loads(self.line(index))
+
+    def close(self):
+        if self._map:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def add_archive_arguments(parser):
+    group = parser.add_argument_group("raw archive")
+    group.add_argument("--archive-dir", metavar="DIR",
+                       help="also stream the raw issue JSON to a compressed JSONL file in DIR")
+    group.add_argument("--archive-format", choices=sorted(EXTENSIONS),
+                       help="archive compression (default: zstd if installed, otherwise gzip)")
+
+
+def open_from_args(args, owner, repo):
+    """
+    Open an ArchiveWriter for one repository, or a no-op context when
+    --archive-dir was not given.
+    """
+    if not args.archive_dir:
+        return contextlib.nullcontext()
+    os.makedirs(args.archive_dir, exist_ok=True)
+    compression = args.archive_format or default_compression()
+    return ArchiveWriter(archive_path(args.archive_dir, owner, repo, compression), compression)
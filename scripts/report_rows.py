@@ -0,0 +1,82 @@
+import datetime
+from openpyxl.styles import Font
+
+from sanitize import sanitize_batch
+
+# -----------------------------------------------------------------------------
+# Shared row building for the issue reports.
+# Every extract_issues_*.py script turns the fetched issues into the same
+# spreadsheet rows; keeping that here means the per-repo workbooks and the
+# combined report (combined_report.py) always agree on the columns.
+# -----------------------------------------------------------------------------
+
+HEADERS = [
+    "Number", "Title", "State", "Created At", "Created Month",
+    "Closed At", "Closed Month", "Days Taken", "Labels"
+]
+
+TITLE_COLUMN = HEADERS.index("Title")
+LABELS_COLUMN = HEADERS.index("Labels")
+
+IST_OFFSET = datetime.timedelta(hours=5, minutes=30)
+LINK_FONT = Font(color="0000EE", underline="single")
+
+
+def issue_url(owner, repo, issue_number):
+    return f"https://github.com/{owner}/{repo}/issues/{issue_number}"
+
+
+def issue_rows(issues, owner, repo):
+    """
+    Build one (row, url) pair per issue, in the column order of HEADERS.
+    Titles and labels are sanitised for Excel in one batch per column.
+    """
+    rows = []
+    for issue in issues:
+        labels = {lbl["name"].lower() for lbl in issue.get("labels", [])}
+        created_at_raw = issue.get("created_at")
+        closed_at_raw = issue.get("closed_at")
+
+        created_date = datetime.datetime.strptime(created_at_raw, "%Y-%m-%dT%H:%M:%SZ") + IST_OFFSET if created_at_raw else None
+        closed_date = datetime.datetime.strptime(closed_at_raw, "%Y-%m-%dT%H:%M:%SZ") + IST_OFFSET if closed_at_raw else None
+
+        created_at = created_date.strftime("%Y-%m-%d") if created_date else ""
+        closed_at = closed_date.strftime("%Y-%m-%d") if closed_date else ""
+        created_month = created_date.strftime("%b-%Y") if created_date else ""
+        closed_month = closed_date.strftime("%b-%Y") if closed_date else ""
+        days_taken = (closed_date - created_date).days if created_date and closed_date else ""
+
+        issue_number = issue["number"]
+        row = [
+            issue_number,
+            issue["title"],
+            issue["state"],
+            created_at,
+            created_month,
+            closed_at,
+            closed_month,
+            days_taken,
+            ", ".join(labels)
+        ]
+
+        rows.append((row, issue_url(owner, repo, issue_number)))
+
+    for column in (TITLE_COLUMN, LABELS_COLUMN):
+        cleaned = sanitize_batch(row[column] for row, _ in rows)
+        for (row, _), value in zip(rows, cleaned):
+            row[column] = value
+    return rows
+
+
+def write_issue_sheet(ws, rows):
+    """
+    Append HEADERS and the (row, url) pairs to an openpyxl worksheet,
+    turning the Number column into a hyperlink to the issue.
+    """
+    ws.append(HEADERS)
+    for row, url in rows:
+        ws.append(row)
+
+        cell = ws.cell(row=ws.max_row, column=1)
+        cell.font = LINK_FONT
+        cell.hyperlink = url
@@ -0,0 +1,219 @@
+import argparse
+import csv
+import importlib
+import io
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import report_window
+import snapshot_merge
+from combined_report import EXTRACTORS
+from github_fetch import fetch_issues
+from report_rows import HEADERS, issue_rows
+
+# -----------------------------------------------------------------------------
+# Script Description:
+# This script serves issue reports over HTTP from a warm local issue cache,
+# instead of a workflow_dispatch and a full crawl per request:
+#   GET /report?repo=node&format=xlsx|csv[&from=YYYY-MM-DD][&to=YYYY-MM-DD][&months=N]
+# Each repository is crawled once on its first request. A background thread
+# then refreshes the loaded repositories incrementally (state=all, since the
+# previous refresh) and bumps their data version when anything changed.
+# Rendered reports are kept in an LRU cache keyed by the resolved window
+# (clamped to the time the data was last changed) and the data version, so a repeated request is answered without rendering again.
+# -----------------------------------------------------------------------------
+
+FORMATS = {
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+class RenderCache:
+    """
+    Thread-safe LRU cache of rendered report bytes.
+    """
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class IssueStore:
+    """
+    Warm issues of one repository plus a version that changes with the data.
+    """
+
+    def __init__(self, extractor):
+        self.extractor = extractor
+        self.version = 0
+        self._issues = None
+        self._refreshed_since = None
+        # Time up to which the issues are complete; only moves with the version
+        self._as_of = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self):
+        return self._issues is not None
+
+    def issues(self):
+        """
+        Return (issues, version, as_of), loading the repository on first use.
+        """
+        with self._lock:
+            if self._issues is None:
+                self._load()
+            return list(self._issues.values()), self.version, self._as_of
+
+    def _load(self):
+        extractor = self.extractor
+        window = report_window.default_window()
+        passes = snapshot_merge.run_passes(extractor.get_issues, window)
+        issues = snapshot_merge.consistent_snapshot(extractor.OWNER, extractor.REPO, passes, window, extractor.headers)
+        self._issues = {issue["number"]: issue for issue in issues}
+        self._refreshed_since = passes[0].started
+        self._as_of = report_window.utc_now()
+        self.version += 1
+
+    def refresh(self):
+        """
+        Merge in the issues updated since the last crawl or refresh.
+        """
+        extractor = self.extractor
+        refresh_started = snapshot_merge.crawl_start()
+        changed = fetch_issues(extractor.OWNER, extractor.REPO, "all", report_window.default_window(),
+                               extractor.headers, since=self._refreshed_since)
+        fetched_at = report_window.utc_now()
+        with self._lock:
+            merged, _ = snapshot_merge.merge_passes([list(self._issues.values()), changed])
+            # Without changes nothing was created since as_of either, so it stays put
+            if any(self._issues.get(number) is not issue for number, issue in merged.items()):
+                self._issues = merged
+                self._as_of = fetched_at
+                self.version += 1
+            self._refreshed_since = refresh_started
+
+
+def render_report(extractor, issues, report_format):
+    if report_format == "xlsx":
+        buffer = io.BytesIO()
+        extractor.issues_to_excel(issues, filename=buffer)
+        return buffer.getvalue()
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(HEADERS)
+    writer.writerows(row for row, _ in issue_rows(issues, extractor.OWNER, extractor.REPO))
+    return buffer.getvalue().encode("utf-8")
+
+
+class ReportHandler(BaseHTTPRequestHandler):
+    stores = {}
+    render_cache = None
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path != "/report":
+            self.send_error(404, "Use /report?repo=<name>&format=xlsx|csv")
+            return
+
+        query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        repo = query.get("repo")
+        report_format = query.get("format", "xlsx")
+        if repo not in EXTRACTORS:
+            self.send_error(400, f"repo must be one of: {', '.join(EXTRACTORS)}")
+            return
+        if report_format not in FORMATS:
+            self.send_error(400, f"format must be one of: {', '.join(FORMATS)}")
+            return
+        try:
+            window = report_window.build_window(
+                report_window.parse_date(query["from"]) if "from" in query else None,
+                report_window.parse_date(query["to"]) if "to" in query else None,
+                int(query["months"]) if "months" in query else None,
+            )
+        except (ValueError, argparse.ArgumentTypeError) as error:
+            self.send_error(400, str(error))
+            return
+
+        store = self.stores[repo]
+        try:
+            issues, version, as_of = store.issues()
+        except Exception as error:
+            # The first crawl of a repository talks to GitHub; report its failure upstream
+            self.send_error(502, f"Fetching issues of {repo} failed: {error}")
+            return
+        # An open-ended window ends now, but nothing newer than as_of is in the
+        # store; clamping keeps the key stable until the data actually changes
+        window = window._replace(end=min(window.end, as_of))
+        key = (repo, window.start_iso, window.end_iso, report_format, version)
+        body = self.render_cache.get(key)
+        cache_status = "HIT"
+        if body is None:
+            cache_status = "MISS"
+            in_window = [issue for issue in issues if window.contains(issue["created_at"])]
+            body = render_report(store.extractor, in_window, report_format)
+            self.render_cache.put(key, body)
+
+        extractor = store.extractor
+        filename = f"issues_{extractor.REPO.replace('-', '_')}.{report_format}"
+        self.send_response(200)
+        self.send_header("Content-Type", FORMATS[report_format])
+        self.send_header("Content-Disposition", f'attachment; filename="{filename}"')
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("X-Data-Version", str(version))
+        self.send_header("X-Cache", cache_status)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def refresh_loop(stores, interval):
+    while True:
+        time.sleep(interval)
+        for name, store in stores.items():
+            if not store.loaded:
+                continue
+            try:
+                store.refresh()
+            except Exception as error:
+                # Keep serving the last good data; the next round retries
+                print(f"⚠️ Refresh of {name} failed: {error}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve issue reports from a warm local cache.")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    parser.add_argument("--port", type=int, default=8000, help="port to listen on")
+    parser.add_argument("--refresh", type=int, default=300, metavar="SECONDS",
+                        help="seconds between incremental refreshes of loaded repositories")
+    parser.add_argument("--cache-size", type=int, default=64, help="rendered reports kept in the LRU cache")
+    args = parser.parse_args()
+
+    ReportHandler.stores = {
+        name: IssueStore(importlib.import_module(f"extract_issues_{name}")) for name in EXTRACTORS
+    }
+    ReportHandler.render_cache = RenderCache(args.cache_size)
+    threading.Thread(target=refresh_loop, args=(ReportHandler.stores, args.refresh), daemon=True).start()
+
+    server = ThreadingHTTPServer((args.host, args.port), ReportHandler)
+    print(f"🌐 Serving reports on http://{args.host}:{args.port}/report?repo=<name>&format=xlsx|csv")
+    server.serve_forever()
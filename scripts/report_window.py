@@ -0,0 +1,116 @@
+import argparse
+import calendar
+import datetime
+from collections import namedtuple
+
+# -----------------------------------------------------------------------------
+# Report window configuration.
+# The window is a pair of naive UTC datetimes (both ends inclusive) that is
+# pushed into the fetch as the `since` parameter and used to filter issues by
+# their creation time. It can be given as:
+#   --from YYYY-MM-DD [--to YYYY-MM-DD]   explicit calendar dates
+#   --months N                            the last N calendar months
+# Without arguments the window covers everything since January 2019.
+# -----------------------------------------------------------------------------
+
+DEFAULT_START = datetime.datetime(2019, 1, 1)
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+class ReportWindow(namedtuple("ReportWindow", ["start", "end"])):
+    __slots__ = ()
+
+    @property
+    def start_iso(self):
+        return self.start.strftime(TIMESTAMP_FORMAT)
+
+    @property
+    def end_iso(self):
+        return self.end.strftime(TIMESTAMP_FORMAT)
+
+    def contains(self, timestamp):
+        """
+        Check a GitHub timestamp ("2024-01-31T12:00:00Z") against the window.
+        The fixed-width ISO format makes a plain string comparison exact.
+        """
+        return self.start_iso <= timestamp <= self.end_iso
+
+    def __str__(self):
+        return f"{self.start_iso}..{self.end_iso}"
+
+
+def utc_now():
+    return datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None, microsecond=0)
+
+
+def add_months(moment, months):
+    """
+    Shift a datetime by whole calendar months, clamping the day to the
+    length of the target month (Mar 31 - 1 month -> Feb 28/29).
+    """
+    month_index = moment.year * 12 + moment.month - 1 + months
+    year, month = divmod(month_index, 12)
+    day = min(moment.day, calendar.monthrange(year, month + 1)[1])
+    return moment.replace(year=year, month=month + 1, day=day)
+
+
+def default_window(now=None):
+    return ReportWindow(DEFAULT_START, now or utc_now())
+
+
+def parse_date(text):
+    try:
+        return datetime.datetime.strptime(text, "%Y-%m-%d")
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date '{text}', expected YYYY-MM-DD")
+
+
+def add_window_arguments(parser):
+    group = parser.add_argument_group("report window")
+    group.add_argument("--from", dest="from_date", type=parse_date, metavar="YYYY-MM-DD",
+                       help="first creation date to include (default: 2019-01-01)")
+    group.add_argument("--to", dest="to_date", type=parse_date, metavar="YYYY-MM-DD",
+                       help="last creation date to include (default: now)")
+    group.add_argument("--months", type=int, metavar="N",
+                       help="only include issues created in the last N calendar months")
+
+
+def build_window(from_date=None, to_date=None, months=None, now=None):
+    """
+    Build a ReportWindow from calendar dates and/or a number of months.
+    Raises ValueError for invalid combinations.
+    """
+    now = now or utc_now()
+    if months is not None and from_date is not None:
+        raise ValueError("months and from cannot be combined")
+    if months is not None and months < 1:
+        raise ValueError("months must be at least 1")
+
+    # The end date is a calendar date, so the whole day is included. Months are
+    # counted back from the midnight that follows the end (the next midnight
+    # when the window is open-ended), so the start is always a day boundary
+    if to_date:
+        boundary = to_date + datetime.timedelta(days=1)
+        end = boundary - datetime.timedelta(seconds=1)
+    else:
+        boundary = now.replace(hour=0, minute=0, second=0) + datetime.timedelta(days=1)
+        end = now
+    if months is not None:
+        start = add_months(boundary, -months)
+    else:
+        start = from_date or DEFAULT_START
+
+    if start > end:
+        raise ValueError(f"the report window starts after it ends ({start:%Y-%m-%d} > {end:%Y-%m-%d})")
+    return ReportWindow(start, end)
+
+
+def window_from_args(parser, args, now=None):
+    """
+    Build the ReportWindow from arguments added by add_window_arguments.
+    Invalid combinations are reported through parser.error.
+    """
+    try:
+        return build_window(args.from_date, args.to_date, args.months, now)
+    except ValueError as error:
+        parser.error(str(error))
@@ -0,0 +1,39 @@
+import re
+
+# -----------------------------------------------------------------------------
+# Shared sanitising for values written to Excel.
+# openpyxl refuses ASCII control characters other than tab, newline and
+# carriage return (it raises IllegalCharacterError at append/save time).
+# Only free-text fields coming from GitHub (titles, label names) can contain
+# them; numbers, states and the formatted dates are always safe and are not
+# passed through here.
+# -----------------------------------------------------------------------------
+
+ILLEGAL_CHARS = "".join(chr(code) for code in range(0x20) if chr(code) not in "\t\n\r")
+ILLEGAL_CHARS_RE = re.compile(f"[{re.escape(ILLEGAL_CHARS)}]")
+_DELETE_ILLEGAL = str.maketrans("", "", ILLEGAL_CHARS)
+
+# Joins a batch for the single fast scan; must itself be a legal character
+_BATCH_SEPARATOR = "\n"
+
+
+def sanitize_string(value):
+    """
+    Remove illegal characters from a string to make it safe for Excel.
+    Strings that are already clean are returned unchanged without copying.
+    """
+    if not isinstance(value, str) or not ILLEGAL_CHARS_RE.search(value):
+        return value
+    return value.translate(_DELETE_ILLEGAL)
+
+
+def sanitize_batch(values):
+    """
+    Sanitise a list of strings.
+    The whole batch is checked with one scan; only when it contains an
+    illegal character are the individual values cleaned.
+    """
+    values = list(values)
+    if not ILLEGAL_CHARS_RE.search(_BATCH_SEPARATOR.join(value for value in values if isinstance(value, str))):
+        return values
+    return [sanitize_string(value) for value in values]
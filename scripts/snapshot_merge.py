@@ -0,0 +1,138 @@
+import datetime
+from collections import namedtuple
+
+from github_fetch import PER_PAGE, fetch_issue, fetch_issues
+from report_window import TIMESTAMP_FORMAT, utc_now
+
+# -----------------------------------------------------------------------------
+# Consistent snapshots from multi-pass crawls.
+# The open and closed passes run minutes apart with offset pagination, so an
+# issue that changes state in between can show up in both passes or in
+# neither. Worse, when an issue already listed by a pass leaves that pass's
+# state while the pass is still running, every later row moves up by one
+# and the row at the next page boundary is never listed. After the passes:
+#   1. all issues are merged by number, keeping the highest updated_at
+#   2. one catch-up listing (state=all, since=crawl start) picks up every
+#      issue that changed while the crawl ran
+#   3. for each pass that lost an already-listed issue while it was running,
+#      the pages of that pass from the issue's position onward are listed
+#      again, which recovers the rows skipped by the shift
+#   4. numbers still seen with conflicting states are re-fetched one by one
+# Only issues touched during the crawl, and the pages from a shift onward,
+# cost extra requests.
+# -----------------------------------------------------------------------------
+
+# Margin for clock differences between this machine and GitHub
+CLOCK_SKEW = datetime.timedelta(minutes=1)
+
+CrawlPass = namedtuple("CrawlPass", ["state", "issues", "started", "finished"])
+
+
+def crawl_start():
+    """
+    Timestamp to take before a crawl, with a margin for clock skew.
+    """
+    return (utc_now() - CLOCK_SKEW).strftime(TIMESTAMP_FORMAT)
+
+
+def crawl_end():
+    return (utc_now() + CLOCK_SKEW).strftime(TIMESTAMP_FORMAT)
+
+
+def run_passes(get_issues, window, archive=None):
+    """
+    Run the open and closed passes of an extractor's get_issues, recording
+    when each one ran (needed to detect page shifts).
+    """
+    passes = []
+    for state in ("open", "closed"):
+        started = crawl_start()
+        issues = get_issues(state, window, archive)
+        passes.append(CrawlPass(state, issues, started, crawl_end()))
+    return passes
+
+
+def merge_passes(passes):
+    """
+    Merge lists of issues by number, keeping the most recently updated copy.
+    Returns (merged issues in first-seen order, numbers seen with more than one state).
+    """
+    merged = {}
+    states = {}
+    for issues in passes:
+        for issue in issues:
+            number = issue["number"]
+            states.setdefault(number, set()).add(issue["state"])
+            current = merged.get(number)
+            if current is None or (issue.get("updated_at") or "") > (current.get("updated_at") or ""):
+                merged[number] = issue
+    conflicts = {number for number, seen in states.items() if len(seen) > 1}
+    return merged, conflicts
+
+
+def _left_during(crawl_pass, issue):
+    """
+    Whether `issue` (current state from the catch-up listing) was listed by
+    the pass and may have left its state before the pass finished.
+    """
+    if issue["state"] == crawl_pass.state:
+        return False
+    # Closing is timed by closed_at; a reopen leaves only updated_at, which is
+    # the latest change and so can only be used to rule out early departures
+    left_at = issue.get("closed_at") if issue["state"] == "closed" else None
+    if left_at:
+        return crawl_pass.started <= left_at <= crawl_pass.finished
+    return (issue.get("updated_at") or "") >= crawl_pass.started
+
+
+def shifted_passes(passes, changed):
+    """
+    Return [(pass, first page to list again)] for the passes that lost issues mid-pass.
+    """
+    current = {issue["number"]: issue for issue in changed}
+    shifted = []
+    for crawl_pass in passes:
+        departed = [
+            index for index, issue in enumerate(crawl_pass.issues)
+            if issue["number"] in current and _left_during(crawl_pass, current[issue["number"]])
+        ]
+        if departed:
+            # Rows after the first departure moved up by one. The pass only kept
+            # issues, so its index is never past the row's position in the
+            # listing (pull requests included) and the page errs on the early side
+            position = max(departed[0] - 1, 0)
+            shifted.append((crawl_pass, position // PER_PAGE + 1))
+    return shifted
+
+
+def consistent_snapshot(owner, repo, passes, window, headers, archive=None):
+    """
+    Merge the passes into one snapshot (see the steps above). If an
+    ArchiveWriter is given, every page fetched here is also written to it.
+    """
+    merged, conflicts = merge_passes([crawl_pass.issues for crawl_pass in passes])
+    crawl_started = min(crawl_pass.started for crawl_pass in passes)
+
+    changed = fetch_issues(owner, repo, "all", window, headers, archive, since=crawl_started)
+    merged, _ = merge_passes([list(merged.values()), changed])
+    # The catch-up listing holds the current state of everything it returned
+    conflicts -= {issue["number"] for issue in changed}
+
+    relisted = 0
+    for crawl_pass, first_page in shifted_passes(passes, changed):
+        issues = fetch_issues(owner, repo, crawl_pass.state, window, headers, archive, first_page=first_page)
+        merged, new_conflicts = merge_passes([list(merged.values()), issues])
+        conflicts |= new_conflicts
+        relisted += 1
+
+    for number in sorted(conflicts):
+        issue = fetch_issue(owner, repo, number, headers, archive)
+        if issue is None or "pull_request" in issue or not window.contains(issue["created_at"]):
+            merged.pop(number, None)
+        else:
+            merged[number] = issue
+
+    if changed or conflicts or relisted:
+        print(f"🔁 {owner}/{repo}: reconciled {len(changed)} issues changed during the crawl, "
+              f"re-listed {relisted} shifted passes, re-fetched {len(conflicts)}")
+    return list(merged.values())
@@ -0,0 +1,130 @@
+import os
+import re
+import threading
+import time
+
+# -----------------------------------------------------------------------------
+# Pool of GitHub tokens.
+# Every request is sent with the token that has the most rate-limit budget
+# left, as reported by the X-RateLimit-Remaining / X-RateLimit-Reset headers
+# of its previous responses. A token that runs out (or hits a secondary rate
+# limit) is retired until its reset time, or for a minute when GitHub does not
+# say; when every token is retired the next request waits for the earliest
+# reset. A token answered with 401 is dropped from the pool for good, and
+# only a pool without tokens left fails.
+# Tokens come from GH_TOKENS (comma or whitespace separated PATs or GitHub App
+# installation tokens) and/or GH_TOKEN.
+# -----------------------------------------------------------------------------
+
+# Budget assumed for a token that has not answered yet, so each one gets tried
+UNKNOWN_REMAINING = float("inf")
+# Seconds a rate-limited token is retired for when no reset time is given
+RETRY_FALLBACK = 60
+
+
+class TokenPool:
+    def __init__(self, tokens):
+        tokens = list(dict.fromkeys(tokens))
+        if not tokens:
+            raise ValueError("A token pool needs at least one token.")
+        self._remaining = {token: UNKNOWN_REMAINING for token in tokens}
+        self._reset_at = {token: 0.0 for token in tokens}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._remaining)
+
+    def acquire(self):
+        """
+        Return the token with the most headroom, waiting if all are exhausted.
+        """
+        while True:
+            with self._lock:
+                if not self._remaining:
+                    raise PermissionError("❌ Every GitHub token in the pool was rejected as unauthorized.")
+                now = time.time()
+                for token, reset_at in self._reset_at.items():
+                    if self._remaining[token] <= 0 and reset_at <= now:
+                        self._remaining[token] = UNKNOWN_REMAINING
+                token = max(self._remaining, key=self._remaining.get)
+                if self._remaining[token] > 0:
+                    # Count the request now so concurrent callers spread out
+                    self._remaining[token] -= 1
+                    return token
+                wait = min(self._reset_at.values()) - now
+            print(f"⏳ All {len(self)} tokens are rate limited; waiting {wait:.0f} seconds.")
+            time.sleep(max(wait, 1))
+
+    def update(self, token, response):
+        """
+        Record the rate-limit state reported by a response sent with `token`.
+        Returns True if the token was rate limited or rejected and the request
+        should be retried with another one.
+        """
+        headers = response.headers
+        with self._lock:
+            if response.status_code == 401:
+                # A revoked or mistyped token: drop it and carry on with the others
+                self._remaining.pop(token, None)
+                self._reset_at.pop(token, None)
+                print(f"⚠️ Dropped an unauthorized token; {len(self._remaining)} left in the pool.")
+                return bool(self._remaining)
+            if token not in self._remaining:
+                return False
+            if "X-RateLimit-Remaining" in headers:
+                self._remaining[token] = int(headers["X-RateLimit-Remaining"])
+            if "X-RateLimit-Reset" in headers:
+                self._reset_at[token] = float(headers["X-RateLimit-Reset"])
+
+            if not _rate_limited(response):
+                return False
+            if "Retry-After" in headers:
+                # Secondary rate limit: retire the token for the requested time
+                self._reset_at[token] = time.time() + int(headers["Retry-After"])
+            elif self._remaining[token] != 0 or "X-RateLimit-Reset" not in headers:
+                # A secondary limit without Retry-After, or an exhausted token
+                # without a reset time: GitHub asks to wait at least a minute
+                self._reset_at[token] = time.time() + RETRY_FALLBACK
+            self._remaining[token] = 0
+            return True
+
+
+def _rate_limited(response):
+    """
+    Whether a response is a (primary or secondary) rate limit rather than,
+    say, a 403 for a resource the token may not access.
+    """
+    if response.status_code == 429:
+        return True
+    if response.status_code != 403:
+        return False
+    if response.headers.get("X-RateLimit-Remaining") == "0" or "Retry-After" in response.headers:
+        return True
+    return "rate limit" in response.text.lower()
+
+
+def tokens_from_env():
+    tokens = re.split(r"[\s,]+", os.getenv("GH_TOKENS", "").strip())
+    tokens.append(os.getenv("GH_TOKEN", "").strip())
+    return [token for token in tokens if token]
+
+
+_default_pool = None
+_default_pool_lock = threading.Lock()
+
+
+def default_pool():
+    """
+    The process-wide pool built from the environment (shared by all repositories).
+    """
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            tokens = tokens_from_env()
+            if not tokens:
+                raise EnvironmentError(
+                    "Missing GitHub token. Please set 'GH_TOKEN' (or several comma-separated tokens in "
+                    "'GH_TOKENS') in your environment or GitHub Actions secrets."
+                )
+            _default_pool = TokenPool(tokens)
+        return _default_pool
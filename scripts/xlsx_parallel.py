@@ -0,0 +1,186 @@
+import os
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from xml.sax.saxutils import escape, quoteattr
+
+from report_rows import HEADERS
+
+# -----------------------------------------------------------------------------
+# Parallel multi-sheet .xlsx writer.
+# openpyxl serialises every worksheet one after another inside `wb.save`.
+# Here each sheet's XML (and its hyperlink relationships) is rendered in a
+# separate process from the (row, url) pairs built by report_rows.issue_rows,
+# and the parent process only assembles the parts into the .xlsx zip.
+# The output matches what issues_to_excel writes: a header row, inline string
+# cells and a blue underlined hyperlink on the Number column.
+# -----------------------------------------------------------------------------
+
+MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+HYPERLINK_REL = REL_NS + "/hyperlink"
+XML_DECL = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+# Style index 1 in STYLES_XML is the hyperlink font used for the Number column
+LINK_STYLE = 1
+
+STYLES_XML = (
+    XML_DECL
+    + f'<styleSheet xmlns="{MAIN_NS}">'
+    '<fonts count="2">'
+    '<font><sz val="11"/><name val="Calibri"/><family val="2"/></font>'
+    '<font><u/><sz val="11"/><color rgb="FF0000EE"/><name val="Calibri"/><family val="2"/></font>'
+    '</fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="2">'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1"/>'
+    '</cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>'
+)
+
+
+def column_letter(index):
+    """
+    Convert a 1-based column index to its spreadsheet letter (1 -> A, 27 -> AA).
+    """
+    letters = ""
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+def _cell_xml(ref, value, style=0):
+    style_attr = f' s="{style}"' if style else ""
+    if value is None or value == "":
+        return ""
+    if isinstance(value, bool):
+        return f'<c r="{ref}" t="b"{style_attr}><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float)):
+        return f'<c r="{ref}"{style_attr}><v>{value}</v></c>'
+    text = str(value)
+    space = ' xml:space="preserve"' if text != text.strip() else ""
+    return f'<c r="{ref}" t="inlineStr"{style_attr}><is><t{space}>{escape(text)}</t></is></c>'
+
+
+def render_sheet(rows):
+    """
+    Render one worksheet from (row, url) pairs.
+    Returns (sheet_xml, sheet_rels_xml) as bytes; rels is None without links.
+    Runs in a worker process, so it only takes and returns picklable values.
+    """
+    letters = [column_letter(i) for i in range(1, len(HEADERS) + 1)]
+    parts = [XML_DECL, f'<worksheet xmlns="{MAIN_NS}" xmlns:r="{REL_NS}"><sheetData>']
+    parts.append('<row r="1">')
+    parts.extend(_cell_xml(f"{letter}1", header) for letter, header in zip(letters, HEADERS))
+    parts.append("</row>")
+
+    links = []
+    for row_index, (row, url) in enumerate(rows, start=2):
+        parts.append(f'<row r="{row_index}">')
+        for col_index, value in enumerate(row):
+            letter = letters[col_index] if col_index < len(letters) else column_letter(col_index + 1)
+            style = LINK_STYLE if col_index == 0 and url else 0
+            parts.append(_cell_xml(f"{letter}{row_index}", value, style))
+        parts.append("</row>")
+        if url:
+            links.append((f"A{row_index}", url))
+    parts.append("</sheetData>")
+
+    rels_xml = None
+    if links:
+        parts.append("<hyperlinks>")
+        rel_parts = [XML_DECL, f'<Relationships xmlns="{PKG_REL_NS}">']
+        for rel_index, (ref, url) in enumerate(links, start=1):
+            parts.append(f'<hyperlink ref="{ref}" r:id="rId{rel_index}"/>')
+            rel_parts.append(
+                f'<Relationship Id="rId{rel_index}" Type="{HYPERLINK_REL}" '
+                f'Target={quoteattr(url)} TargetMode="External"/>'
+            )
+        parts.append("</hyperlinks>")
+        rel_parts.append("</Relationships>")
+        rels_xml = "".join(rel_parts).encode("utf-8")
+
+    parts.append("</worksheet>")
+    return "".join(parts).encode("utf-8"), rels_xml
+
+
+def _package_parts(sheet_titles):
+    count = len(sheet_titles)
+    overrides = "".join(
+        f'<Override PartName="/xl/worksheets/sheet{i}.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        for i in range(1, count + 1)
+    )
+    content_types = (
+        XML_DECL
+        + '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/styles.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+        + overrides
+        + "</Types>"
+    )
+    root_rels = (
+        XML_DECL
+        + f'<Relationships xmlns="{PKG_REL_NS}">'
+        f'<Relationship Id="rId1" Type="{REL_NS}/officeDocument" Target="xl/workbook.xml"/>'
+        "</Relationships>"
+    )
+    sheets = "".join(
+        f'<sheet name={quoteattr(title)} sheetId="{i}" r:id="rId{i}"/>'
+        for i, title in enumerate(sheet_titles, start=1)
+    )
+    workbook = (
+        XML_DECL
+        + f'<workbook xmlns="{MAIN_NS}" xmlns:r="{REL_NS}"><sheets>{sheets}</sheets></workbook>'
+    )
+    workbook_rels = (
+        XML_DECL
+        + f'<Relationships xmlns="{PKG_REL_NS}">'
+        + "".join(
+            f'<Relationship Id="rId{i}" Type="{REL_NS}/worksheet" Target="worksheets/sheet{i}.xml"/>'
+            for i in range(1, count + 1)
+        )
+        + f'<Relationship Id="rId{count + 1}" Type="{REL_NS}/styles" Target="styles.xml"/>'
+        "</Relationships>"
+    )
+    return {
+        "[Content_Types].xml": content_types,
+        "_rels/.rels": root_rels,
+        "xl/workbook.xml": workbook,
+        "xl/_rels/workbook.xml.rels": workbook_rels,
+        "xl/styles.xml": STYLES_XML,
+    }
+
+
+def write_workbook(sheets, filename, max_workers=None):
+    """
+    Write a multi-sheet workbook from {sheet_title: [(row, url), ...]}.
+    Sheets are rendered in parallel worker processes and zipped in order.
+    """
+    titles = list(sheets)
+    if max_workers is None:
+        max_workers = min(len(titles), os.cpu_count() or 1) or 1
+
+    if max_workers > 1 and len(titles) > 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            rendered = list(executor.map(render_sheet, (sheets[title] for title in titles)))
+    else:
+        rendered = [render_sheet(sheets[title]) for title in titles]
+
+    with zipfile.ZipFile(filename, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, xml in _package_parts(titles).items():
+            archive.writestr(name, xml)
+        for index, (sheet_xml, rels_xml) in enumerate(rendered, start=1):
+            archive.writestr(f"xl/worksheets/sheet{index}.xml", sheet_xml)
+            if rels_xml:
+                archive.writestr(f"xl/worksheets/_rels/sheet{index}.xml.rels", rels_xml)